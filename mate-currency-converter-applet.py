@@ -10,90 +10,324 @@ Based on code from:
 - https://api.exchangerate.host
 - https://dev.to/vladned/calculating-the-number-of-seconds-until-midnight-383d
 - https://stackoverflow.com/a/45986036/586382
+- https://urllib3.readthedocs.io/en/stable/advanced-usage.html
+- https://pygobject.readthedocs.io/en/latest/guide/threading.html
 """
 
-from datetime import date, datetime, timedelta, time, tzinfo
-from json import dumps, loads
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+from json import dump, dumps, load, loads
 from locale import LC_MONETARY, localeconv, setlocale
-from threading import Timer
-from urllib.request import urlopen
-from xml.etree import ElementTree
+from math import ceil
+from os import fdopen, makedirs, path, remove, replace, stat, utime
+from sys import intern
+from tempfile import mkstemp
+from threading import Lock
+from time import time
+from traceback import print_exception
 
 from gi import require_version
-from gi.repository.Gio import Settings
-from gi.repository.Gtk import ComboBoxText, Grid, SpinButton
+
+# Versions must be set before importing the modules
+require_version("Gtk", "3.0")
+require_version('MatePanelApplet', '4.0')
+
+from gi.repository.Gio import Settings, SettingsBindFlags
+from gi.repository.GLib import (
+    get_user_cache_dir, idle_add, source_remove, timeout_add_seconds
+)
+from gi.repository.Gtk import ComboBoxText, Grid, ListStore, SpinButton
 from gi.repository.MatePanelApplet import Applet
 
 
 base_url = 'https://api.exchangerate.host'
 URL_ISO4217 = "https://www.six-group.com/dam/download/financial-information/data-center/iso-currrency/lists/list-one.xml"
 
+CACHE_DIR = path.join(get_user_cache_dir(), "mate-currency-converter")
+CACHE_ISO4217 = path.join(CACHE_DIR, "iso4217.json")
 
-require_version("Gtk", "3.0")
-require_version('MatePanelApplet', '4.0')
+# Run fetches outside of GTK main loop thread, so they don't block the UI
+_executor = ThreadPoolExecutor(max_workers=3)
+
+_http_pool = None
+_http_pool_lock = Lock()
+
+
+def _http():
+    """Get the HTTP connections pool
+
+    Connections (and their TLS sessions) to `base_url` and `URL_ISO4217` are
+    reused between fetches, and their responses are requested compressed.
+    urllib3 is imported on first fetch, so it's not loaded on startup when
+    the stored rate is still valid.
+    """
+    global _http_pool
+
+    # Fetches run concurrently, ensure only one pool gets created
+    with _http_pool_lock:
+        if _http_pool is None:
+            from urllib3 import PoolManager, Timeout
+
+            # Stalled connections would hold executor workers forever, and
+            # block the applet from exiting
+            _http_pool = PoolManager(
+                num_pools=2, maxsize=2,
+                headers={"Accept-Encoding": "gzip, deflate"},
+                timeout=Timeout(connect=10, read=30)
+            )
+
+    return _http_pool
+
+
+def _fetch_in_background(callback, fetcher):
+    """Run `fetcher` in background, and call `callback` with its result
+
+    `callback` is called on GTK main loop thread, so it can safely update
+    settings and widgets. If `fetcher` fails, its error is reported there
+    instead, and `callback` is not called.
+    """
+    def on_done(future):
+        idle_add(_on_fetched, callback, future)
+
+    _executor.submit(fetcher).add_done_callback(on_done)
+
+
+def _on_fetched(callback, future):
+    error = future.exception()
+
+    # TODO: detect network failures and retry on reconnect
+    if error is not None:
+        print_exception(type(error), error, error.__traceback__)
+    else:
+        callback(future.result())
+
+    # Don't run again on next main loop iteration
+    return False
+
+
+def _get(url, etag="", lastmod=""):
+    """Request `url`, conditionally to the `etag` and `lastmod` validators
+
+    Returns `None` if the resource has not been modified since they were got,
+    and raises `HTTPError` if it could not be got.
+    """
+    from urllib3.exceptions import HTTPError
+
+    http = _http()
+
+    headers = dict(http.headers)
+    if etag:
+        headers["If-None-Match"] = etag
+    if lastmod:
+        headers["If-Modified-Since"] = lastmod
+
+    res = http.request("GET", url, headers=headers)
+
+    if res.status == 304:
+        return None
+
+    # Don't process error pages as if they were the requested resource
+    if res.status != 200:
+        raise HTTPError(f"GET {url} failed with status {res.status}")
+
+    return res
+
+
+def _get_iso4217(etag="", lastmod="", force=False):
+    """Get currencies definitions, and their validators
+
+    Returns `None` if they have not changed, in that case they can be get from
+    disk cache with `_load_iso4217()`. If `force` is set, disk cache is not
+    checked for being up to date.
+    """
+    # Disk cache has been updated today (in UTC, like the rates), don't check
+    # for changes
+    try:
+        mtime = stat(CACHE_ISO4217).st_mtime
+
+        if (
+            not force and
+            datetime.fromtimestamp(mtime, timezone.utc).date().isoformat()
+            == _utc_today()
+        ):
+            return None
+    except OSError:
+        pass
+
+    res = _get(URL_ISO4217, etag, lastmod)
+    if res is None:
+        # Mark disk cache as up to date
+        try:
+            utime(CACHE_ISO4217)
+        except OSError:
+            pass
+
+        return None
+
+    # Only import XML parser when currencies definitions need to be parsed
+    from io import BytesIO
+    from xml.etree import ElementTree
+
+    # Stream the document instead of building its full tree, we only need the
+    # currencies code and minor units of each country entry
+    iso4217 = {}
+    for _, CcyNtry in ElementTree.iterparse(BytesIO(res.data)):
+        if CcyNtry.tag != "CcyNtry":
+            continue
+
+        Ccy = CcyNtry.findtext("Ccy")
+        if Ccy:
+            # Minor units are "N.A." for currencies without them, like gold
+            CcyMnrUnts = CcyNtry.findtext("CcyMnrUnts", "")
+            iso4217[Ccy] = int(CcyMnrUnts) if CcyMnrUnts.isdigit() else 0
+
+        CcyNtry.clear()
+
+    _store_iso4217(iso4217)
+
+    return (
+        iso4217, res.headers.get("ETag", ""),
+        res.headers.get("Last-Modified", "")
+    )
+
+
+def _load_iso4217():
+    """Get currencies definitions from disk cache, or `None` if missing"""
+    try:
+        with open(CACHE_ISO4217) as f:
+            return load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_iso4217(iso4217):
+    """Store currencies definitions in disk cache
+
+    Cache is only an optimization, so failing to write it is ignored.
+    """
+    try:
+        makedirs(CACHE_DIR, exist_ok=True)
+
+        # Write to a unique temporary file and rename it, so the cache is never
+        # left partially written, not even by several applets at once
+        fd, tmp = mkstemp(dir=CACHE_DIR)
+    except OSError:
+        return
+
+    try:
+        with fdopen(fd, "w") as f:
+            dump(iso4217, f)
+
+        replace(tmp, CACHE_ISO4217)
+    except OSError:
+        try:
+            remove(tmp)
+        except OSError:
+            pass
+
+
+def _loads_symbols(symbols):
+    """Parse stored symbols, interning their currencies codes"""
+    return {intern(code): digits for code, digits in loads(symbols).items()}
+
+
+def _loads_last_fetch(last_fetch):
+    """Parse stored last fetched rate, interning its currencies codes"""
+    last_fetch = loads(last_fetch)
+
+    last_fetch["base"] = intern(last_fetch["base"])
+    last_fetch["secondary"] = intern(last_fetch["secondary"])
+
+    return last_fetch
+
+
+def _utc_today():
+    """Get current day in UTC, the same timezone used for the rates dates"""
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def _get_rates(currency_base):
+    """Get rates of all the available currencies"""
+    res = _get(f"{base_url}/latest?base={currency_base}")
+
+    # `loads()` detects and decodes UTF-8 bytes by itself
+    return loads(res.data)
 
 
 class MateCurrencyConverterApplet(Applet):
     def __init__(self, applet):
+        # Current day, updated at midnight UTC
+        self._today = _utc_today()
+
         # Get and config settings store
         settings = Settings(applet.get_preferences_path())
-        settings.connect(
-            "changed::currency_base", self._on_settings_currency_base_changed,
-            currency_base, currency_secondary
-        )
-        settings.connect(
-            "changed::currency_secondary",
-            self._on_settings_currency_secondary_changed, currency_base,
-            currency_secondary
-        )
-        settings.connect(
-            "changed::date", self._fetch_rate, currency_base,
-            currency_secondary
-        )
-        settings.connect(
-            "changed::quantity", self._on_settings_quantity_changed
-        )
-        settings.connect("changed::rate", self._convert)
-        settings.connect(
-            "changed::symbols", self._on_settings_symbols_changed,
-            currency_base, quantity_base, currency_secondary,
-            quantity_secondary
-        )
-        settings.connect(
-            "changed::_quantities_order_inverted",
-            self._on_settings_quantities_order_inverted_changed
-        )
+
+        # Last fetched rate, with its date and currencies. They are stored
+        # together in a single key, so they are read and written at once
+        self._last_fetch = _loads_last_fetch(settings.get_string("last_fetch"))
 
         # Create grid for applet layout
         grid = Grid()
 
-        # Create and init widgets
+        # Create widgets
         quantity_base = SpinButton()
-        quantity_base.connect(
-            "value-changed", self._on_quantity_changed, quantity_secondary,
-            false, settings
-        )
+        quantity_secondary = SpinButton()
 
         # TODO: Show symbol on applet, and symbol + full name on dropdown
         currency_base = ComboBoxText()
+        currency_secondary = ComboBoxText()
+
+        # Connect widgets events
+        quantity_base.connect(
+            "value-changed", self._on_quantity_changed, False, settings
+        )
         currency_base.connect(
             "changed", self._on_currency_changed, currency_base,
             currency_secondary, settings
         )
-
-        quantity_secondary = SpinButton()
         quantity_secondary.connect(
-            "value-changed", self._on_quantity_changed, quantity_base, true,
-            settings
+            "value-changed", self._on_quantity_changed, True, settings
         )
-
-        # TODO: Show symbol on applet, and symbol + full name on dropdown
-        currency_secondary = ComboBoxText()
         currency_secondary.connect(
             "changed", self._on_currency_changed, currency_base,
             currency_secondary, settings
         )
 
+        # Keep selected currencies stored. They are stored apart from the ones
+        # of the last fetched rate, so they can be bound to their dropdowns
+        settings.bind(
+            "currency_base", currency_base, "active-id",
+            SettingsBindFlags.DEFAULT
+        )
+        settings.bind(
+            "currency_secondary", currency_secondary, "active-id",
+            SettingsBindFlags.DEFAULT
+        )
+
+        # Connect settings events
+        settings.connect(
+            "changed::last_fetch", self._on_settings_last_fetch_changed
+        )
+        settings.connect(
+            "changed::quantity", self._on_settings_quantity_changed
+        )
+        settings.connect(
+            "changed::symbols", self._on_settings_symbols_changed,
+            currency_base, quantity_base, currency_secondary,
+            quantity_secondary
+        )
+        settings.connect(
+            "changed::_quantities_order_inverted",
+            self._on_settings_quantities_order_inverted_changed
+        )
+
+        self._applet = applet
+        self._currency_base = currency_base
+        self._currency_secondary = currency_secondary
+        self._quantity_base = quantity_base
+        self._quantity_secondary = quantity_secondary
+
         # Re-hydrate stored settings
         quantity = settings.get_float("quantity")
         if settings.get_boolean("_quantities_order_inverted"):
@@ -101,10 +335,15 @@ class MateCurrencyConverterApplet(Applet):
         else:
             quantity_secondary.set_value(quantity)
 
+        self._currencies = frozenset()
+        self._symbols = _loads_symbols(settings.get_string("symbols"))
+        self._available = None
+        self._iso4217 = None
         self._symbols_changed(
             currency_base, quantity_base, currency_secondary,
             quantity_secondary, settings
         )
+        self._rate_changed(settings)
         self._convert(settings)
 
         # Add widgets to grid
@@ -127,115 +366,157 @@ class MateCurrencyConverterApplet(Applet):
     # Object API
     def __del__(self):
         try:
-            self._timer.cancel()
+            source_remove(self._timeout)
+        except AttributeError:
+            pass
 
     # Private methods
     def _convert(self, settings):
-        currency_base = self._currency_base.get_active_text()
-        currency_secondary = self._currency_secondary.get_active_text()
-
-        rate = settings.get_float("rate")
-
-        self.set_tooltip_text(
-            f"1 {currency_base} = {rate} {currency_secondary}\n"
-            f"1 {currency_secondary} = {1/rate} {currency_base}"
-        )
-
-        quantity_base = self._quantity_base
-        quantity_secondary = self._quantity_secondary
+        dest = self._dest
 
-        if settings.get_boolean("_quantities_order_inverted"):
-            quantity_base.set_value(quantity_secondary.get_value() / rate)
-        else:
-            quantity_secondary.set_value(quantity_base.get_value() * rate)
+        # Don't process converted quantity as if user had changed it
+        dest.handler_block_by_func(self._on_quantity_changed)
+        try:
+            dest.set_value(self._source.get_value() * self._forward_factor)
+        finally:
+            dest.handler_unblock_by_func(self._on_quantity_changed)
 
     def _fetch(
         self, quantity_base, currency_base, quantity_secondary,
         currency_secondary, settings
     ):
         """Keep rates and symbols updated on each day changes"""
-        # Fetch and update symbols
+        # Fetch symbols and rate concurrently. Widgets get updated from the
+        # `changed::symbols` and `changed::last_fetch` settings events
         self._fetch_symbols(currency_base, currency_secondary, settings)
-        self._symbols_changed(
-            currency_base, quantity_base, currency_secondary,
-            quantity_secondary, settings
-        )
 
-        # Fetch rate
-        self._fetch_rate(currency_base, currency_secondary, settings)
+        # Available currencies are got from the fetched rates. If there are no
+        # stored symbols, no currencies can be selected to fetch their rate,
+        # so get them from the rates of the stored base currency
+        if (
+            not self._fetch_rate(currency_base, currency_secondary, settings)
+            and not self._symbols
+        ):
+            self._fetch_available(settings)
 
-        now = datetime.now()
         # Historical exchange rates are available at 00:05am GMT (UTC), see
-        # https://exchangerate.host/#/#faq
-        midnight = datetime.combine(
-            now + timedelta(days=1), time(0, 5), timezone.utc
-        )
-        seconds_until_midnight = (midnight - now).seconds
-
-        timer = Timer(
-            seconds_until_midnight, self._fetch,
-            [
-                quantity_base, currency_base, quantity_secondary,
-                currency_secondary, settings
-            ]
+        # https://exchangerate.host/#/#faq. Unix time days start at midnight
+        # UTC, so the local timezone doesn't change when it happens; current
+        # day must be computed in UTC too to match the rates dates
+        seconds_until_midnight = ceil(86400 - (time() - 300) % 86400)
+
+        # Timeout can fire slightly before 00:05am, in that case schedule the
+        # update for next day instead of running it again right away
+        if seconds_until_midnight < 2:
+            seconds_until_midnight += 86400
+
+        self._timeout = timeout_add_seconds(
+            seconds_until_midnight, self._on_midnight, quantity_base,
+            currency_base, quantity_secondary, currency_secondary, settings
         )
-        timer.start()
-
-        self._timer = timer
 
     def _fetch_rate(self, currency_base, currency_secondary, settings):
-        # Check if currencies are different to previous ones, or date changed
-        today = date.today().isoformat()
+        """Fetch rate of selected currencies, returns if it's being fetched"""
+        currency_base = currency_base.get_active_text()
+        currency_secondary = currency_secondary.get_active_text()
+
+        # Currencies are not available yet
+        if currency_base is None or currency_secondary is None:
+            return False
+
+        currency_base = intern(currency_base)
+        currency_secondary = intern(currency_secondary)
+
+        # Check if date changed, or currencies are different to previous ones.
+        # Date is checked first since it's the most likely to have changed
+        last_fetch = self._last_fetch
         if (
-            settings.get_string("currency_base")      == currency_base      &&
-            settings.get_string("currency_secondary") == currency_secondary &&
-            settings.get_string("date")               == today
+            last_fetch["date"]      == self._today   and
+            last_fetch["base"]      == currency_base and
+            last_fetch["secondary"] == currency_secondary
         ):
-            return
+            return False
 
         # Fetch updated rate
         # TODO: detect network failures and retry on reconnect
+        _fetch_in_background(
+            partial(
+                self._on_rate_fetched, currency_base, currency_secondary,
+                settings
+            ),
+            partial(_get_rates, currency_base)
+        )
 
-        with urlopen(
-            f"{base_url}/latest?"
-            f"base={currency_base}&symbols={currency_secondary}"
-        ) as f:
-            res_body = f.read()
+        return True
 
-        json = loads(res_body.decode("utf-8"))
-        rate = json["rates"][currency_secondary]
+    def _fetch_available(self, settings):
+        """Fetch available currencies from the stored base currency rates"""
+        _fetch_in_background(
+            partial(self._on_rates_fetched, settings),
+            partial(_get_rates, self._last_fetch["base"])
+        )
 
-        settings.set_string("date", json["date"])
-        settings.set_text("currency_base", currency_base)
-        settings.set_text("currency_secondary", currency_secondary)
-        settings.set_float("rate", rate)
+    def _fetch_symbols(
+        self, currency_base, currency_secondary, settings, force=False
+    ):
+        # TODO: detect network failures and retry on reconnect
 
-        # Convert currencies with updated rate
-        self._convert(settings)
+        # Don't download again currencies definitions if they have not
+        # changed. Available currencies are got from the fetched rates
+        _fetch_in_background(
+            partial(
+                self._on_iso4217_fetched, currency_base, currency_secondary,
+                settings
+            ),
+            partial(
+                _get_iso4217, settings.get_string("iso4217_etag"),
+                settings.get_string("iso4217_lastmod"), force
+            )
+        )
 
-    def _fetch_symbols(self, currency_base, currency_secondary, settings):
-        # TODO: detect network failures and retry on reconnect
+    def _quantities_order_changed(self, settings):
+        """Set which quantity is converted into the other one, and by what"""
+        if settings.get_boolean("_quantities_order_inverted"):
+            self._source = self._quantity_secondary
+            self._dest = self._quantity_base
+            self._forward_factor = self._inv_rate
+        else:
+            self._source = self._quantity_base
+            self._dest = self._quantity_secondary
+            self._forward_factor = self._rate
+
+    def _rate_changed(self, settings):
+        last_fetch = self._last_fetch
+        rate = last_fetch["rate"]
+
+        self._rate = rate
+        self._inv_rate = 1 / rate
+
+        self._quantities_order_changed(settings)
+
+        # Tooltip only depends on the rate, don't update it on each conversion
+        currency_base = last_fetch["base"]
+        currency_secondary = last_fetch["secondary"]
 
-        # Get currencies definitions
-        with urlopen(URL_ISO4217) as f:
-            res_body = f.read()
+        self._applet.set_tooltip_text(
+            f"1 {currency_base} = {rate} {currency_secondary}\n"
+            f"1 {currency_secondary} = {self._inv_rate} {currency_base}"
+        )
 
-        root = ET.fromstring(res_body.decode("utf-8"))
+    def _update_symbols(self, settings):
+        """Store available currencies that have a definition"""
+        iso4217 = self._iso4217
+        available = self._available
 
-        iso4217 = {
-            CcyNtry['Ccy'].text: CcyNtry['CcyMnrUnts'].text
-                for CcyNtry in root[0]
-                if CcyNtry['Ccy']
-        }
+        # Both currencies definitions and available currencies are needed
+        if iso4217 is None or available is None:
+            return
 
-        # Get available currencies
-        with urlopen(f"{base_url}/symbols") as f:
-            res_body = f.read()
+        symbols = {k: iso4217[k] for k in iso4217.keys() & available}
 
-        json = loads(res_body.decode("utf-8"))
-        symbols = {
-            k: v for k, v in iso4217.iteritems() if k in json["symbols"].keys()
-        }
+        # Symbols are unchanged, don't emit settings event
+        if symbols == self._symbols:
+            return
 
         settings.set_string("symbols", dumps(symbols))
 
@@ -243,27 +524,115 @@ class MateCurrencyConverterApplet(Applet):
         self, currency_base, quantity_base, currency_secondary,
         quantity_secondary, settings
     ):
-        symbols = loads(settings.get_string("symbols"))
+        symbols = self._symbols
 
-        # Set quantities
-        quantity_base.set_digits(symbols[settings.get_string("currency_base")])
-        quantity_secondary.set_digits(
-            symbols[settings.get_string("currency_secondary")]
-        )
+        selected_base = settings.get_string("currency_base")
+        selected_secondary = settings.get_string("currency_secondary")
 
-        # Set currencies
-        currency_base.remove_all()
-        currency_secondary.remove_all()
+        # Set quantities. Stored currencies may not be available (yet)
+        for quantity, currency in (
+            (quantity_base, selected_base),
+            (quantity_secondary, selected_secondary)
+        ):
+            digits = symbols.get(currency)
+            if digits is not None:
+                quantity.set_digits(digits)
 
-        for symbol in symbols.keys():
-            currency_base.append(symbol, symbol)
-            currency_secondary.append(symbol, symbol)
+        # Set currencies, only if they have changed
+        if symbols.keys() == self._currencies:
+            return
+
+        self._currencies = frozenset(symbols)
+
+        # Both dropdowns share the same model, with symbols as text and id
+        store = ListStore(str, str)
+        for symbol in sorted(symbols):
+            store.append([symbol, symbol])
+
+        currency_base.set_model(store)
+        currency_secondary.set_model(store)
+
+        # Changing the model unselects the currencies, select again the stored
+        # ones, since bindings only update the dropdowns on settings changes
+        currency_base.set_active_id(selected_base)
+        currency_secondary.set_active_id(selected_secondary)
+
+    # Fetch events
+    def _on_rate_fetched(
+        self, currency_base, currency_secondary, settings, json
+    ):
+        self._on_rates_fetched(settings, json)
+
+        # Selected currencies changed while fetching, don't overwrite the rate
+        # of the new ones with this one, since fetches can finish out of order
+        if (
+            self._currency_base.get_active_id()      != currency_base or
+            self._currency_secondary.get_active_id() != currency_secondary
+        ):
+            return
+
+        # Currencies get converted with the updated rate from the
+        # `changed::last_fetch` settings event
+        settings.set_string("last_fetch", dumps({
+            "date": json["date"],
+            "base": currency_base,
+            "secondary": currency_secondary,
+            "rate": json["rates"][currency_secondary]
+        }))
+
+    def _on_rates_fetched(self, settings, json):
+        # Rates are given for all the available currencies, maybe except base
+        self._available = frozenset(json["rates"]) | {json["base"]}
+        self._update_symbols(settings)
+
+    def _on_iso4217_fetched(
+        self, currency_base, currency_secondary, settings, iso4217
+    ):
+        if iso4217 is None:
+            # Currencies definitions are unchanged and already loaded
+            if self._iso4217 is not None:
+                return
+
+            iso4217 = _load_iso4217()
+
+            # Disk cache is not available, download currencies definitions
+            # again without validators, even if it was updated today
+            if iso4217 is None:
+                settings.set_string("iso4217_etag", "")
+                settings.set_string("iso4217_lastmod", "")
+
+                self._fetch_symbols(
+                    currency_base, currency_secondary, settings, True
+                )
+                return
+        else:
+            iso4217, iso4217_etag, iso4217_lastmod = iso4217
+
+            settings.set_string("iso4217_etag", iso4217_etag)
+            settings.set_string("iso4217_lastmod", iso4217_lastmod)
+
+            # Currencies definitions changed, symbols need to be recomputed
+            if self._available is None:
+                self._fetch_available(settings)
+
+        self._iso4217 = iso4217
+        self._update_symbols(settings)
+
+    # Timeout events
+    def _on_midnight(
+        self, quantity_base, currency_base, quantity_secondary,
+        currency_secondary, settings
+    ):
+        self._today = _utc_today()
 
-        currency_base.set_active_id(settings.get_string("currency_base"))
-        currency_secondary.set_active_id(
-            settings.get_string("currency_secondary")
+        self._fetch(
+            quantity_base, currency_base, quantity_secondary,
+            currency_secondary, settings
         )
 
+        # `_fetch()` has already scheduled the next day update
+        return False
+
     # Widgets events
     def _on_currency_changed(
         self, currency, currency_base, currency_secondary, settings
@@ -284,27 +653,29 @@ class MateCurrencyConverterApplet(Applet):
         self._convert(settings)
 
     # Settings events
-    def _on_settings_currency_base_changed(
-        self, settings, currency_base, currency_secondary
-    ):
-        currency_base.set_value(settings.get_string("currency_base"))
-
-        self._fetch_rate(currency_base, currency_secondary, settings)
-
-    def _on_settings_currency_secondary_changed(
-        self, settings, currency_base, currency_secondary
-    ):
-        currency_secondary.set_value(settings.get_string("currency_secondary"))
-
-        self._fetch_rate(currency_base, currency_secondary, settings)
-
     def _on_settings_quantity_changed(self, settings):
         quantity = settings.get_float("quantity")
 
         if settings.get_boolean("_quantities_order_inverted"):
-            self._quantity_secondary.set_value(quantity)
+            quantity_widget = self._quantity_secondary
         else:
-            self._quantity_base.set_value(quantity)
+            quantity_widget = self._quantity_base
+
+        # Quantity is already shown, nothing to update
+        if quantity_widget.get_value() == quantity:
+            return
+
+        quantity_widget.set_value(quantity)
+
+        self._convert(settings)
+
+    def _on_settings_quantities_order_inverted_changed(self, settings):
+        self._quantities_order_changed(settings)
+
+    def _on_settings_last_fetch_changed(self, settings):
+        self._last_fetch = _loads_last_fetch(settings.get_string("last_fetch"))
+
+        self._rate_changed(settings)
 
         self._convert(settings)
 
@@ -312,6 +683,13 @@ class MateCurrencyConverterApplet(Applet):
         self, settings, currency_base, quantity_base, currency_secondary,
         quantity_secondary
     ):
+        symbols = _loads_symbols(settings.get_string("symbols"))
+
+        # Symbols have not changed, don't rebuild currencies dropdowns
+        if symbols == self._symbols:
+            return
+
+        self._symbols = symbols
         self._symbols_changed(
             currency_base, quantity_base, currency_secondary,
             quantity_secondary, settings